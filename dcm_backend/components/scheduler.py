@@ -11,15 +11,106 @@ import zoneinfo as zoneinfo_
 import threading
 import abc
 import traceback
+import heapq
+import itertools
+import time
 
-import dateutil
+from dateutil.relativedelta import relativedelta
 
 from dcm_backend.models import Schedule, TimeUnit
 
 
+# average duration of a month in seconds (used to locate the previous
+# execution within a monthly schedule)
+_SECONDS_PER_MONTH = 604800 * 4.345
+
+# `TimeUnit`s that are planned as multiples of a fixed duration; maps
+# to name of unit (used in messages), duration in seconds, and whether
+# to report deviations from the schedule
+_SIMPLE_UNITS = {
+    TimeUnit.SECOND: ("seconds", 1, False),
+    TimeUnit.MINUTE: ("minutes", 60, False),
+    TimeUnit.HOUR: ("hours", 3600, True),
+    TimeUnit.DAY: ("days", 86400, True),
+    TimeUnit.WEEK: ("weeks", 604800, True),
+}
+
+
+class _TimeoutReactor:
+    """
+    Shared waiter for all running `Timeout`s.
+
+    A single daemon-thread keeps the deadlines of all started
+    `Timeout`s in a heap (based on `time.monotonic`) and hands every
+    due `Timeout` off to its own callback-thread.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[float, int, "Timeout"]] = []
+        self._counter = itertools.count()
+        self._stale = 0
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, timeout: "Timeout", deadline: float) -> None:
+        """Registers `timeout` to become due at `deadline`."""
+        with self._condition:
+            heapq.heappush(
+                self._heap, (deadline, next(self._counter), timeout)
+            )
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._target, daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    def discard(self) -> None:
+        """
+        Notifies the reactor that one of its `Timeout`s has completed
+        early (i.e. has been canceled). Stale heap-entries are dropped
+        once they make up the majority of the heap.
+        """
+        with self._condition:
+            self._stale += 1
+            if self._stale * 2 > len(self._heap):
+                self._heap = [
+                    entry for entry in self._heap if not entry[2].fired
+                ]
+                heapq.heapify(self._heap)
+                self._stale = 0
+
+    def _next(self) -> "Timeout":
+        """Blocks until the next `Timeout` is due and returns it."""
+        with self._condition:
+            while True:
+                while self._heap and self._heap[0][2].fired:
+                    heapq.heappop(self._heap)
+                    self._stale = max(0, self._stale - 1)
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+                remaining = self._heap[0][0] - time.monotonic()
+                if remaining <= 0:
+                    return heapq.heappop(self._heap)[2]
+                self._condition.wait(min(remaining, threading.TIMEOUT_MAX))
+
+    def _target(self) -> None:
+        """Thread-target that dispatches due `Timeout`s."""
+        while True:
+            self._next().fire(False)
+
+
+_REACTOR = _TimeoutReactor()
+
+
 class Timeout:
     """
-    Thread-based timeout-implementation.
+    Timeout-implementation.
+
+    Waiting is delegated to a single thread shared by all `Timeout`s;
+    callbacks are executed in a dedicated thread once the timeout is
+    either due or canceled.
 
     Keyword arguments:
     timeout -- timeout duration
@@ -56,16 +147,16 @@ class Timeout:
         self._timeout_event = threading.Event()
         self._cancel_event = threading.Event()
 
-        self._t = threading.Thread(target=self._target)
+        self._fire_lock = threading.Lock()
+        self._fired = False
 
-    def _target(self) -> Callable[[], None]:
+    def _target(self, canceled: bool) -> None:
         """
-        Thread-target that handles waiting until timing out and
-        running callbacks given to the `Timeout`-constructor.
+        Thread-target that runs callbacks given to the
+        `Timeout`-constructor.
         """
-        self._start_event.set()
         try:
-            if self._cancel_event.wait(self._timeout):
+            if canceled:
                 self._on_cancel()
             else:
                 self._on_timeout()
@@ -76,13 +167,28 @@ class Timeout:
             self._on_error(exc_info)
         self._timeout_event.set()
 
+    def fire(self, canceled: bool) -> None:
+        """
+        Starts callback-execution (at most once per `Timeout`).
+
+        Keyword arguments:
+        canceled -- whether to run the cancel- or the timeout-callbacks
+        """
+        with self._fire_lock:
+            if self._fired:
+                return
+            self._fired = True
+        threading.Thread(target=self._target, args=(canceled,)).start()
+
     def start(self) -> None:
         """Starts the timeout."""
         if self._start_event.is_set():
             raise RuntimeError("Cannot re-use Timeout objects.")
-        self._t.start()
-        if not self._start_event.wait(5):
-            raise RuntimeError("Timeout did not start.")
+        self._start_event.set()
+        if self._cancel_event.is_set():
+            self.fire(True)
+            return
+        _REACTOR.add(self, time.monotonic() + self._timeout)
 
     def cancel(
         self, wait: bool = False, timeout: Optional[float] = None
@@ -95,6 +201,9 @@ class Timeout:
         self._cancel_event.set()
         if not self._start_event.is_set():
             return
+        if not self._fired:
+            self.fire(True)
+            _REACTOR.discard()
         if wait:
             self.wait(timeout)
 
@@ -103,10 +212,17 @@ class Timeout:
         """Returns total (initial) duration for this timeout."""
         return self._timeout
 
+    @property
+    def fired(self) -> bool:
+        """Returns `True` if callback-execution has been started."""
+        return self._fired
+
     @property
     def running(self) -> bool:
         """Returns `True` if the timeout is running."""
-        return self._t.is_alive()
+        return (
+            self._start_event.is_set() and not self._timeout_event.is_set()
+        )
 
     @property
     def canceled(self) -> bool:
@@ -175,6 +291,10 @@ class Scheduler:
         self._plans: dict[str, ExecutionPlan] = {
             # mapping of ExecutionPlan-id and associated ExecutionPlan-object
         }
+        self._plans_by_config: dict[str, dict[str, ExecutionPlan]] = {
+            # mapping of ScheduledJobConfig-id and associated
+            # ExecutionPlans (by ExecutionPlan-id)
+        }
         self._plans_lock = threading.RLock()
 
     def _should_be_scheduled(self, schedule: Optional[Schedule]) -> bool:
@@ -224,8 +344,8 @@ class Scheduler:
     ) -> Optional[datetime]:
         """
         Returns datetime of next execution for x-scheduling. `unit` is
-        the keyword-name for a call to `datetime.timedelta` and factor
-        is the conversion factor from seconds to that unit.
+        the name of the unit (used in messages) and `factor` is the
+        duration of that unit in seconds.
         """
         if previous is None:
             return self._make_tz_aware(config.schedule.start)
@@ -249,11 +369,8 @@ class Scheduler:
                 file=sys.stderr,
             )
         return _start + timedelta(
-            **{
-                unit: round(
-                    previous_iteration + config.schedule.repeat.interval
-                )
-            }
+            seconds=factor
+            * round(previous_iteration + config.schedule.repeat.interval)
         )
 
     def _plan_monthly(
@@ -274,8 +391,7 @@ class Scheduler:
         previous_iteration = (
             (_previous - _start).total_seconds()
             / config.schedule.repeat.interval
-            / 604800
-            / 4.345
+            / _SECONDS_PER_MONTH
         )
         if 0.33 < previous_iteration % 1 < 0.66:
             print(
@@ -287,7 +403,7 @@ class Scheduler:
         return datetime.combine(
             (
                 _start.date()
-                + dateutil.relativedelta.relativedelta(
+                + relativedelta(
                     months=round(
                         previous_iteration + config.schedule.repeat.interval
                     )
@@ -311,19 +427,11 @@ class Scheduler:
             # active without repeat-info
             return self._plan_onetime(config, previous)
 
-        match config.schedule.repeat.unit:
-            case TimeUnit.SECOND:
-                return self._plan_x(config, previous, "seconds", 1, False)
-            case TimeUnit.MINUTE:
-                return self._plan_x(config, previous, "minutes", 60, False)
-            case TimeUnit.HOUR:
-                return self._plan_x(config, previous, "hours", 3600, True)
-            case TimeUnit.DAY:
-                return self._plan_x(config, previous, "days", 86400, True)
-            case TimeUnit.WEEK:
-                return self._plan_x(config, previous, "weeks", 604800, True)
-            case TimeUnit.MONTH:
-                return self._plan_monthly(config, previous)
+        unit = config.schedule.repeat.unit
+        if unit in _SIMPLE_UNITS:
+            return self._plan_x(config, previous, *_SIMPLE_UNITS[unit])
+        if unit == TimeUnit.MONTH:
+            return self._plan_monthly(config, previous)
 
         raise NotImplementedError(
             f"Unable to plan schedule for job-configuration '{config.id_}'."
@@ -344,11 +452,12 @@ class Scheduler:
         """
         # work in default-timezone
         _at = self._make_tz_aware(at).astimezone(self.zoneinfo)
+        now = datetime.now(self.zoneinfo)
 
         # configure re-schedule callback
         if re_schedule:
             # `at` may lie in the past, this enables proper re-scheduling
-            _re_schedule_at = max(_at, datetime.now(self.zoneinfo))
+            _re_schedule_at = max(_at, now)
 
             def on_success():
                 self.schedule(config, _re_schedule_at)
@@ -361,9 +470,7 @@ class Scheduler:
             config=config,
             at=_at,
             timeout=Timeout(
-                timeout=max(
-                    0, (_at - datetime.now(self.zoneinfo)).total_seconds()
-                ),
+                timeout=max(0, (_at - now).total_seconds()),
                 on_timeout=self._factory(config),
                 on_success=on_success,
                 # remove record from planned jobs
@@ -375,19 +482,43 @@ class Scheduler:
                 ),
             ),
         )
-        with self._plans_lock:
-            self._plans[id_] = plan
+        self._register_plan(plan)
         plan.timeout.start()
         return plan
 
+    def _register_plan(self, plan: ExecutionPlan) -> None:
+        """Adds `plan` to internal records."""
+        with self._plans_lock:
+            self._plans[plan.id_] = plan
+            self._plans_by_config.setdefault(plan.config.id_, {})[
+                plan.id_
+            ] = plan
+
+    def _unregister_plan(self, id_: str) -> None:
+        """
+        Removes `ExecutionPlan` with `id_` from internal records (if
+        present).
+        """
+        with self._plans_lock:
+            plan = self._plans.pop(id_, None)
+            if plan is None:
+                return
+            plans = self._plans_by_config.get(plan.config.id_)
+            if plans is None:
+                return
+            plans.pop(id_, None)
+            if not plans:
+                del self._plans_by_config[plan.config.id_]
+
     def get_plans(self, id_: Optional[str] = None) -> list[ExecutionPlan]:
         """
         Returns all registered `ExecutionPlan`s. If a
         `ScheduledJobConfig.id_` is given, filter for associated plans.
         """
-        if id_ is None:
-            return list(self._plans.values())
-        return [p for p in self._plans.values() if p.config.id_ == id_]
+        with self._plans_lock:
+            if id_ is None:
+                return list(self._plans.values())
+            return list(self._plans_by_config.get(id_, {}).values())
 
     def clear_jobs(
         self, id_: str, wait: bool = False, timeout: Optional[float] = None
@@ -400,11 +531,7 @@ class Scheduler:
         while (plans := self.get_plans(id_)):
             for plan in plans:
                 plan.timeout.cancel(wait, timeout)
-                with self._plans_lock:
-                    try:
-                        del self._plans[plan.id_]
-                    except KeyError:
-                        pass
+                self._unregister_plan(plan.id_)
 
     def clear_plan(
         self, id_: str, wait: bool = False, timeout: Optional[float] = None
@@ -420,8 +547,7 @@ class Scheduler:
             return
         if not plan.timeout.canceled:
             plan.timeout.cancel(wait, timeout)
-            with self._plans_lock:
-                del self._plans[id_]
+            self._unregister_plan(id_)
 
     def clear(
         self, wait: bool = False, timeout: Optional[float] = None
@@ -435,12 +561,7 @@ class Scheduler:
             plans = list(self._plans.values())
             for plan in plans:
                 plan.timeout.cancel(wait, timeout)
-
-                with self._plans_lock:
-                    try:
-                        del self._plans[plan.id_]
-                    except KeyError:
-                        pass
+                self._unregister_plan(plan.id_)
 
     def schedule_at(
         self, config: ScheduledJobConfig, at: Optional[datetime] = None
@@ -1,7 +1,9 @@
 """Flask cleanup startup-extension."""
 
 from typing import Optional, Iterable
+import os
 import signal
+from uuid import uuid4
 from datetime import datetime, timedelta
 from pathlib import Path
 from shutil import rmtree
@@ -15,7 +17,6 @@ from dcm_common.services.extensions.common import (
     ExtensionLoaderResult,
     _ExtensionRequirement,
 )
-from dcm_common.util import list_directory_content
 
 from dcm_backend.config import AppConfig
 
@@ -41,55 +42,65 @@ def run_cleanup(
         return
 
     now = datetime.now().isoformat()
-    for artifact_id, path in db.custom_cmd(
+    expired_artifacts = db.custom_cmd(
         f"SELECT id, path FROM artifacts WHERE datetime_expires < '{now}'",
         False,
-    ).eval("getting expired artifacts"):
+    ).eval("getting expired artifacts")
+    for _, path in expired_artifacts:
         print_status(f"Cleaning up expired artifact '{path}'.")
         artifact = file_storage / path
         try:
-            if artifact.exists():
-                if artifact.is_file():
-                    artifact.unlink()
-                else:
-                    rmtree(artifact)
+            if artifact.is_dir():
+                rmtree(artifact)
+            else:
+                artifact.unlink(missing_ok=True)
         except OSError as exc_info:
             print_status(
                 f"Unable to clean up artifact '{path}' due to "
                 + f"{type(exc_info).__name__}: {exc_info}"
             )
-        finally:
-            db.delete("artifacts", artifact_id).eval(
-                "drop expired artifact-record"
-            )
+    if expired_artifacts:
+        with db.new_transaction() as t:
+            for artifact_id, _ in expired_artifacts:
+                t.add_delete("artifacts", artifact_id, "id")
+        t.result.eval("dropping expired artifact-records")
 
     # discover unknown artifacts
     recorded_artifacts = db.get_column("artifacts", "path").eval(
         "getting previously recorded artifacts"
     )
     current_artifacts = []
-    # iterate all cleanup-targets
+    file_storage_resolved = file_storage.resolve()
+    # iterate all cleanup-targets (only files and directories qualify as
+    # artifacts)
     for target in targets:
-        current_artifacts.extend(
-            map(
-                lambda p: str(Path.relative_to(p, file_storage.resolve())),
-                list_directory_content(
-                    target, "*", lambda p: p.is_file() or p.is_dir()
-                ),
+        if not target.is_dir():
+            continue
+        with os.scandir(target) as entries:
+            current_artifacts.extend(
+                str(Path(entry.path).relative_to(file_storage_resolved))
+                for entry in entries
+                if entry.is_file() or entry.is_dir()
             )
-        )
 
     # write new records to database
-    expiration = (datetime.now() + timedelta(seconds=artifact_ttl)).isoformat()
-    for artifact in set(current_artifacts) - set(recorded_artifacts):
-        print_status(f"Artifact '{artifact}' expires at {expiration}.")
-        db.insert(
-            "artifacts",
-            {
-                "path": artifact,
-                "datetime_expires": expiration,
-            },
-        )
+    new_artifacts = set(current_artifacts) - set(recorded_artifacts)
+    if new_artifacts:
+        expiration = (
+            datetime.now() + timedelta(seconds=artifact_ttl)
+        ).isoformat()
+        with db.new_transaction() as t:
+            for artifact in new_artifacts:
+                print_status(f"Artifact '{artifact}' expires at {expiration}.")
+                t.add_insert(
+                    "artifacts",
+                    {
+                        "id": str(uuid4()),
+                        "path": artifact,
+                        "datetime_expires": expiration,
+                    },
+                )
+        t.result.eval("registering new artifacts")
 
     print_status("Scheduled cleanup completed.")
 
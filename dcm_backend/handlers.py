@@ -2,6 +2,7 @@
 
 from typing import Any
 from pathlib import Path
+from functools import lru_cache
 
 from data_plumber import Pipeline
 from data_plumber_http import (
@@ -147,19 +148,24 @@ def get_post_artifact_handler(file_storage: Path):
     ).assemble()
 
 
-def get_config_id_handler(required: bool = True, also_allow: list[str] = None):
+@lru_cache
+def get_config_id_handler(
+    required: bool = True, also_allow: tuple[str, ...] = None
+):
     """
-    Returns parameterized handler
+    Returns parameterized handler (cached per combination of arguments)
 
     Keyword arguments
     required -- whether field 'id' is required
                 (default True)
+    also_allow -- names of additional fields that are accepted
+                  (default None)
     """
     return Object(
         properties={
             Property("id", "id_", required=required): String(pattern=r".+")
         },
-        accept_only=["id"] + (also_allow or []),
+        accept_only=["id"] + list(also_allow or ()),
     ).assemble()
 
 
@@ -191,13 +197,15 @@ ConfigurationMetadataModified = {
 }
 
 
+@lru_cache
 def get_job_config_handler(
     require_id: bool,
     accept_creation_md: bool = False,
     accept_modification_md: bool = False,
 ) -> ConditionalPipeline:
     """
-    Returns a `JobConfig`-handler.
+    Returns a `JobConfig`-handler. Handlers are cached per combination
+    of arguments.
 
     Keyword arguments:
     require_id -- if `True`, `id_` is required
@@ -499,13 +507,15 @@ post_job_completion_handler = Object(
 ).assemble()
 
 
+@lru_cache
 def get_user_config_handler(
     require_id: bool,
     accept_creation_md: bool = False,
     accept_modification_md: bool = False,
 ) -> ConditionalPipeline:
     """
-    Returns a `UserConfig`-handler.
+    Returns a `UserConfig`-handler. Handlers are cached per combination
+    of arguments.
 
     Keyword arguments:
     require_id -- if `True`, `id_` is required
@@ -627,13 +637,15 @@ user_change_password_handler = Object(
 ).assemble()
 
 
+@lru_cache
 def get_workspace_config_handler(
     require_id: bool,
     accept_creation_md: bool = False,
     accept_modification_md: bool = False,
 ) -> Pipeline:
     """
-    Returns a `WorkspaceConfig`-handler.
+    Returns a `WorkspaceConfig`-handler. Handlers are cached per combination
+    of arguments.
 
     Keyword arguments:
     require_id -- if `True`, `id_` is required
@@ -658,13 +670,15 @@ def get_workspace_config_handler(
     ).assemble()
 
 
+@lru_cache
 def get_template_config_handler(
     require_id: bool,
     accept_creation_md: bool = False,
     accept_modification_md: bool = False,
 ) -> ConditionalPipeline:
     """
-    Returns a `Template`-handler.
+    Returns a `Template`-handler. Handlers are cached per combination
+    of arguments.
 
     Keyword arguments:
     require_id -- if `True`, `id_` is required
@@ -53,7 +53,7 @@ class ArtifactView(services.OrchestratedView):
     def configure_bp(self, bp: Blueprint, *args, **kwargs) -> None:
         @bp.route("/artifact", methods=["GET"])
         @flask_handler(  # unknown query
-            handler=handlers.get_config_id_handler(True, ["downloadName"]),
+            handler=handlers.get_config_id_handler(True, ("downloadName",)),
             json=flask_args,
         )
         def download_bundle(id_: str):
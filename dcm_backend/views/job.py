@@ -20,6 +20,12 @@ from dcm_backend.components import Scheduler, JobProcessorAdapter
 from dcm_backend import handlers
 
 
+# controlled vocabulary for filtering jobs by status
+_JOB_STATUS_FILTER_VALUES = frozenset(
+    ("queued", "running", "completed", "aborted")
+)
+
+
 class JobView(View):
     """
     View-class for managing job-execution.
@@ -395,13 +401,7 @@ class JobView(View):
                         map(
                             lambda s: f"status = '{s}'",
                             filter(
-                                lambda s: s
-                                in [
-                                    "queued",
-                                    "running",
-                                    "completed",
-                                    "aborted",
-                                ],
+                                lambda s: s in _JOB_STATUS_FILTER_VALUES,
                                 status.split(","),
                             ),
                         )
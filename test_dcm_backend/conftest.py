@@ -13,6 +13,13 @@ from dcm_common.services.tests import (
 from dcm_backend.config import AppConfig
 
 
+def pytest_configure(config):
+    """Registers custom markers."""
+    config.addinivalue_line(
+        "markers", "http: test depends on a locally served stub-service"
+    )
+
+
 @pytest.fixture(scope="session", name="fixtures")
 def _fixtures():
     return Path("test_dcm_backend/fixtures/")
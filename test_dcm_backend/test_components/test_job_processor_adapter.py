@@ -1,4 +1,9 @@
-"""JobProcessorAdapter-component test-module."""
+"""
+JobProcessorAdapter-component test-module.
+
+All tests in this module run against a stub Job Processor-service and
+are marked as `http` (deselect with `pytest -m "not http"`).
+"""
 
 import pytest
 from dcm_common.services import APIResult
@@ -6,17 +11,20 @@ from dcm_common.services import APIResult
 from dcm_backend.components import JobProcessorAdapter
 
 
-@pytest.fixture(name="port")
+pytestmark = pytest.mark.http
+
+
+@pytest.fixture(scope="module", name="port")
 def _port():
     return 8080
 
 
-@pytest.fixture(name="url")
+@pytest.fixture(scope="module", name="url")
 def _url(port):
     return f"http://localhost:{port}"
 
 
-@pytest.fixture(name="adapter")
+@pytest.fixture(scope="module", name="adapter")
 def _adapter(url):
     return JobProcessorAdapter(url)
 
@@ -26,12 +34,12 @@ def _target():
     return None
 
 
-@pytest.fixture(name="request_body")
+@pytest.fixture(scope="module", name="request_body")
 def _request_body():
     return {"process": {"id": "abc"}}
 
 
-@pytest.fixture(name="token")
+@pytest.fixture(scope="module", name="token")
 def _token():
     return {
         "value": "eb7948a58594df3400696b6ce12013b0e26348ef27e",
@@ -40,8 +48,10 @@ def _token():
     }
 
 
-@pytest.fixture(name="report")
-def _report(url, token, request_body):
+@pytest.fixture(
+    scope="module", name="report", params=[True, False], ids=["ok", "fail"]
+)
+def _report(request, url, token, request_body):
     return {
         "host": url,
         "token": token,
@@ -61,7 +71,7 @@ def _report(url, token, request_body):
             ]
         },
         "data": {
-            "success": True,
+            "success": request.param,
             "issues": 0,
             "records": {
                 "record-0": {
@@ -78,12 +88,6 @@ def _report(url, token, request_body):
     }
 
 
-@pytest.fixture(name="report_fail")
-def _report_fail(report):
-    report["data"]["success"] = False
-    return report
-
-
 @pytest.fixture(name="job_processor")
 def _job_processor(port, token, report, run_service):
     run_service(
@@ -96,18 +100,6 @@ def _job_processor(port, token, report, run_service):
     )
 
 
-@pytest.fixture(name="job_processor_fail")
-def _job_processor_fail(port, token, report_fail, run_service):
-    run_service(
-        routes=[
-            ("/process", lambda: (token, 201), ["POST"]),
-            ("/progress", lambda: (report_fail["progress"], 200), ["GET"]),
-            ("/report", lambda: (report_fail, 200), ["GET"]),
-        ],
-        port=port,
-    )
-
-
 def test_run(
     adapter: JobProcessorAdapter, request_body, target, report, job_processor
 ):
@@ -118,20 +110,6 @@ def test_run(
     assert info.report["progress"] == report["progress"]
 
 
-def test_run_fail(
-    adapter: JobProcessorAdapter,
-    request_body,
-    target,
-    report_fail,
-    job_processor_fail,
-):
-    """Test method `run` of `JobProcessorAdapter`."""
-    adapter.run(request_body, target, info := APIResult())
-    assert info.completed
-    assert info.success
-    assert info.report["progress"] == report_fail["progress"]
-
-
 def test_success(
     adapter: JobProcessorAdapter, request_body, target, job_processor
 ):
@@ -140,14 +118,6 @@ def test_success(
     assert adapter.success(info)
 
 
-def test_success_fail(
-    adapter: JobProcessorAdapter, request_body, target, job_processor_fail
-):
-    """Test property `success` of `JobProcessorAdapter`."""
-    adapter.run(request_body, target, info := APIResult())
-    assert adapter.success(info)
-
-
 def test_get_report(
     adapter: JobProcessorAdapter, token, report, job_processor
 ):
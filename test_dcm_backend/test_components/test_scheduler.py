@@ -2,7 +2,8 @@
 
 from typing import Optional
 import os
-from time import time, sleep
+from time import time
+from collections import deque
 from datetime import datetime, timedelta
 import zoneinfo
 import threading
@@ -28,15 +29,27 @@ class Callback:
     def __init__(self):
         self.first_run = threading.Event()
         self.has_been_called = False
-        self.has_been_called_with = []
+        # keeps only the most recent calls
+        self.has_been_called_with = deque(maxlen=16)
         self.call_count = 0
+        self._called = threading.Condition()
 
     def callback(self, *args, **kwargs):
         """Generic callback-method."""
-        self.has_been_called = True
-        self.has_been_called_with.append((args, kwargs))
-        self.call_count += 1
-        self.first_run.set()
+        with self._called:
+            self.has_been_called = True
+            self.has_been_called_with.append((args, kwargs))
+            self.call_count += 1
+            self.first_run.set()
+            self._called.notify_all()
+
+    def wait_for_calls(self, n: int, timeout: Optional[float] = None) -> bool:
+        """
+        Halts until the callback has been called at least `n` times or
+        `timeout` is exceeded. Returns `True` if `n` calls were made.
+        """
+        with self._called:
+            return self._called.wait_for(lambda: self.call_count >= n, timeout)
 
 
 @dataclass
@@ -47,6 +60,15 @@ class JobConfig(ScheduledJobConfig):
     schedule: Optional[Schedule] = None
 
 
+@pytest.fixture(scope="module", name="planner")
+def _planner():
+    """
+    Returns a `Scheduler` that is shared by tests which only call
+    `Scheduler.plan` (and, hence, do not schedule any jobs).
+    """
+    return Scheduler(lambda c: Callback().callback)
+
+
 def test_timeout_basic():
     """Test basic timeout."""
     on_timeout = Callback()
@@ -152,9 +174,11 @@ def test_scheduler_schedule_at_datetime():
         JobConfig("test-id"),
         datetime.now() + timedelta(seconds=2 * VERY_SHORT),
     )
-    # does not run immediately
-    sleep(VERY_SHORT)
+    # does not run immediately but is planned for later
     assert not on_timeout.has_been_called
+    assert plan.timeout.timeout == pytest.approx(
+        2 * VERY_SHORT, abs=VERY_SHORT
+    )
 
     # does run at some point
     on_timeout.first_run.wait()
@@ -298,9 +322,11 @@ def test_scheduler_schedule_wo_repeat():
             ),
         )
     )
-    # does not run immediately
-    sleep(VERY_SHORT)
+    # does not run immediately but is planned for later
     assert not on_timeout.has_been_called
+    assert plan.timeout.timeout == pytest.approx(
+        2 * VERY_SHORT, abs=VERY_SHORT
+    )
 
     # does run at some point
     on_timeout.first_run.wait()
@@ -327,9 +353,11 @@ def test_scheduler_schedule_repeat():
             ),
         )
     )
-    # does not run immediately
-    sleep(VERY_SHORT)
+    # does not run immediately but is planned for later
     assert not on_timeout.has_been_called
+    assert plan.timeout.timeout == pytest.approx(
+        2 * VERY_SHORT, abs=VERY_SHORT
+    )
 
     # does run at some point
     on_timeout.first_run.wait()
@@ -363,60 +391,63 @@ def test_scheduler_schedule_repeat_start_in_past():
         )
     )
     # does run immediately
-    plan.timeout.wait(VERY_SHORT)
-    assert on_timeout.has_been_called
-
-    # wait a VERY_SHORT while longer
-    sleep(VERY_SHORT)
+    assert on_timeout.wait_for_calls(1, VERY_SHORT)
 
-    # did not run repeatedly
+    # did not run repeatedly within a VERY_SHORT while longer
+    assert not on_timeout.wait_for_calls(2, VERY_SHORT)
     assert on_timeout.call_count == 1
 
     s.clear(True)
 
 
-def test_scheduler_plan_end():
+def test_scheduler_plan_end(planner: Scheduler):
     """Test method `Scheduler.plan` for job with end-date."""
     now = datetime.now().astimezone()
     past = now + timedelta(days=-1)
 
-    s = Scheduler(lambda c: Callback().callback)
-
-    assert s.plan(JobConfig("test-id", Schedule(True, start=now)), None) == now
     assert (
-        s.plan(JobConfig("test-id", Schedule(True, start=now, end=past)), None)
+        planner.plan(JobConfig("test-id", Schedule(True, start=now)), None)
+        == now
+    )
+    assert (
+        planner.plan(
+            JobConfig("test-id", Schedule(True, start=now, end=past)), None
+        )
         is None
     )
 
 
-def test_scheduler_plan_onetime():
+def test_scheduler_plan_onetime(planner: Scheduler):
     """Test method `Scheduler.plan` for onetime-scheduling."""
     now = datetime.now().astimezone()
     future = now + timedelta(days=1)
 
-    s = Scheduler(lambda c: Callback().callback)
-
     assert (
-        s.plan(JobConfig("test-id"), None) is None
+        planner.plan(JobConfig("test-id"), None) is None
     ), "case: no schedule, no previous"
     assert (
-        s.plan(JobConfig("test-id", Schedule(False)), None) is None
+        planner.plan(JobConfig("test-id", Schedule(False)), None) is None
     ), "case: schedule-false, no previous"
     assert (
-        s.plan(JobConfig("test-id", Schedule(True, start=now)), None) == now
+        planner.plan(JobConfig("test-id", Schedule(True, start=now)), None)
+        == now
     ), "case: schedule now, no previous"
     assert (
-        s.plan(JobConfig("test-id", Schedule(True, start=future)), None)
+        planner.plan(JobConfig("test-id", Schedule(True, start=future)), None)
         == future
     ), "case: schedule future, no previous"
     assert (
-        s.plan(JobConfig("test-id", Schedule(True, start=now)), now) is None
+        planner.plan(JobConfig("test-id", Schedule(True, start=now)), now)
+        is None
     ), "case: schedule now, previously now"
     assert (
-        s.plan(JobConfig("test-id", Schedule(True, start=future)), now) is None
+        planner.plan(JobConfig("test-id", Schedule(True, start=future)), now)
+        is None
     ), "case: schedule future, previously now"
     assert (
-        s.plan(JobConfig("test-id", Schedule(True, start=future)), future)
+        planner.plan(
+            JobConfig("test-id", Schedule(True, start=future)), future
+        )
         is None
     ), "case: schedule future, previously future"
 
@@ -432,53 +463,32 @@ def test_scheduler_plan_onetime():
     ],
     ids=["seconds", "minutes", "hours", "days", "weeks"],
 )
-def test_scheduler_plan_simple_units(timedelta_unit, enum_unit):
+def test_scheduler_plan_simple_units(
+    planner: Scheduler, timedelta_unit, enum_unit
+):
     """Test method `Scheduler.plan` for simple unit-scheduling."""
     now = datetime.now().astimezone()
     future = now + timedelta(**{timedelta_unit: 1})
-
-    s = Scheduler(lambda c: Callback().callback)
+    config = JobConfig(
+        "test-id", Schedule(True, start=now, repeat=Repeat(enum_unit))
+    )
 
     assert (
-        s.plan(
-            JobConfig(
-                "test-id",
-                Schedule(True, start=now, repeat=Repeat(enum_unit)),
-            ),
-            None,
-        )
-        == now
+        planner.plan(config, None) == now
     ), "case: schedule now, no previous"
     assert (
-        s.plan(
-            JobConfig(
-                "test-id",
-                Schedule(True, start=now, repeat=Repeat(enum_unit)),
-            ),
-            now,
-        )
-        == future
+        planner.plan(config, now) == future
     ), "case: schedule now, previously now"
     assert (
-        s.plan(
-            JobConfig(
-                "test-id",
-                Schedule(True, start=now, repeat=Repeat(enum_unit)),
-            ),
-            now + timedelta(**{timedelta_unit: 0.4}),
-        )
+        planner.plan(config, now + timedelta(**{timedelta_unit: 0.4}))
         == future
     ), f"case: schedule now, previously now + .4 {timedelta_unit}"
-    assert s.plan(
-        JobConfig(
-            "test-id",
-            Schedule(True, start=now, repeat=Repeat(enum_unit)),
-        ),
-        now + timedelta(**{timedelta_unit: 0.6}),
+    assert planner.plan(
+        config, now + timedelta(**{timedelta_unit: 0.6})
     ) == future + timedelta(
         **{timedelta_unit: 1}
     ), f"case: schedule now, previously now + .6 {timedelta_unit}"
-    assert s.plan(
+    assert planner.plan(
         JobConfig(
             "test-id",
             Schedule(True, start=now, repeat=Repeat(enum_unit, 2)),
@@ -489,15 +499,13 @@ def test_scheduler_plan_simple_units(timedelta_unit, enum_unit):
     ), f"case: schedule now, previously now, 2-{timedelta_unit} interval"
 
 
-def test_scheduler_plan_monthly():
+def test_scheduler_plan_monthly(planner: Scheduler):
     """Test method `Scheduler.plan` for monthly-scheduling."""
     tzinfo = datetime.now().astimezone().tzinfo
     now = datetime(2025, 1, 1, 12)
     future = datetime(2025, 2, 1, 12)
 
-    s = Scheduler(lambda c: Callback().callback)
-
-    assert s.plan(
+    assert planner.plan(
         JobConfig(
             "test-id",
             Schedule(True, start=now, repeat=Repeat(TimeUnit.MONTH)),
@@ -506,7 +514,7 @@ def test_scheduler_plan_monthly():
     ).astimezone(tzinfo) == now.astimezone(
         tzinfo
     ), "case: schedule now, no previous"
-    assert s.plan(
+    assert planner.plan(
         JobConfig(
             "test-id",
             Schedule(True, start=now, repeat=Repeat(TimeUnit.MONTH)),
@@ -515,7 +523,7 @@ def test_scheduler_plan_monthly():
     ).astimezone(tzinfo) == future.astimezone(
         tzinfo
     ), "case: schedule now, previously now"
-    assert s.plan(
+    assert planner.plan(
         JobConfig(
             "test-id",
             Schedule(True, start=now, repeat=Repeat(TimeUnit.MONTH)),
@@ -524,7 +532,7 @@ def test_scheduler_plan_monthly():
     ).astimezone(tzinfo) == future.astimezone(
         tzinfo
     ), "case: schedule now, previously now + ~.4 months"
-    assert s.plan(
+    assert planner.plan(
         JobConfig(
             "test-id",
             Schedule(True, start=now, repeat=Repeat(TimeUnit.MONTH)),
@@ -533,7 +541,7 @@ def test_scheduler_plan_monthly():
     ).astimezone(tzinfo) == datetime(2025, 3, 1, 12).astimezone(
         tzinfo
     ), "case: schedule now, previously now + ~.6 months"
-    assert s.plan(
+    assert planner.plan(
         JobConfig(
             "test-id",
             Schedule(True, start=now, repeat=Repeat(TimeUnit.MONTH, 2)),
@@ -546,7 +554,7 @@ def test_scheduler_plan_monthly():
     #  # special cases
 
     #  ## start-date at end of month
-    assert s.plan(  # starting on Jan 31st
+    assert planner.plan(  # starting on Jan 31st
         JobConfig(
             "test-id",
             Schedule(
@@ -557,7 +565,7 @@ def test_scheduler_plan_monthly():
         ),
         datetime(2025, 1, 31, 12, tzinfo=tzinfo),
     ).astimezone(tzinfo) == datetime(2025, 2, 28, 12, tzinfo=tzinfo)
-    assert s.plan(  # starting on Jan 31st, previous on Feb 28th
+    assert planner.plan(  # starting on Jan 31st, previous on Feb 28th
         JobConfig(
             "test-id",
             Schedule(
@@ -568,7 +576,7 @@ def test_scheduler_plan_monthly():
         ),
         datetime(2025, 2, 28, 12, tzinfo=tzinfo),
     ).astimezone(tzinfo) == datetime(2025, 3, 31, 12, tzinfo=tzinfo)
-    assert s.plan(  # starting on Jan 31st, previous on Mar 31st
+    assert planner.plan(  # starting on Jan 31st, previous on Mar 31st
         JobConfig(
             "test-id",
             Schedule(
@@ -579,7 +587,7 @@ def test_scheduler_plan_monthly():
         ),
         datetime(2025, 3, 31, 12, tzinfo=tzinfo),
     ).astimezone(tzinfo) == datetime(2025, 4, 30, 12, tzinfo=tzinfo)
-    assert s.plan(  # starting on Jan 31st, previous on Sep 30th
+    assert planner.plan(  # starting on Jan 31st, previous on Sep 30th
         JobConfig(
             "test-id",
             Schedule(
@@ -592,7 +600,7 @@ def test_scheduler_plan_monthly():
     ).astimezone(tzinfo) == datetime(2025, 10, 31, 12, tzinfo=tzinfo)
 
     # ## start date close to end of year
-    assert s.plan(
+    assert planner.plan(
         JobConfig(
             "test-id",
             Schedule(
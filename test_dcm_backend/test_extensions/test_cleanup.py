@@ -15,7 +15,7 @@ from dcm_backend.extensions.cleanup import run_cleanup
 from dcm_backend.config import AppConfig
 
 
-@pytest.fixture(name="db")
+@pytest.fixture(scope="module", name="db")
 def _db():
     # setup empty database
     db = SQLiteAdapter3(allow_overflow=False)
@@ -23,6 +23,25 @@ def _db():
     return db
 
 
+@pytest.fixture(autouse=True)
+def clear_artifacts(db: SQLiteAdapter3):
+    """Empties the artifacts-table after every test."""
+    yield
+    db.custom_cmd(
+        "DELETE FROM artifacts", clear_schema_cache=False
+    ).eval("clearing artifacts")
+
+
+def count_artifacts(db: SQLiteAdapter3) -> int:
+    """Returns the number of records in the artifacts-table."""
+    return db.encode(
+        db.custom_cmd(
+            "SELECT COUNT(*) FROM artifacts", clear_schema_cache=False
+        ).eval("counting artifacts")[0][0],
+        "integer",
+    )
+
+
 @pytest.fixture(name="cleanup_target")
 def _cleanup_target(file_storage: Path):
     # setup cleanup-directory
@@ -52,7 +71,7 @@ def test_run_cleanup_simple(
         [],
     )
 
-    assert len(db.get_column("artifacts", "id").eval()) == 2
+    assert count_artifacts(db) == 2
     assert (cleanup_target / "some-file").is_file()
     assert (cleanup_target / "some-directory").is_dir()
     assert result.ready.is_set()
@@ -67,7 +86,7 @@ def test_run_cleanup_simple(
         [],
     )
 
-    assert len(db.get_column("artifacts", "id").eval()) == 0
+    assert count_artifacts(db) == 0
     assert not (cleanup_target / "some-file").is_file()
     assert not (cleanup_target / "some-directory").is_dir()
 
@@ -89,7 +108,7 @@ def test_run_cleanup_missing_requirement(
         [ExtensionConditionRequirement(lambda: False, "test")],
     )
 
-    assert len(db.get_column("artifacts", "id").eval()) == 0
+    assert count_artifacts(db) == 0
     assert (cleanup_target / "some-file").is_file()
     assert (cleanup_target / "some-directory").is_dir()
 
@@ -112,7 +131,7 @@ def test_run_cleanup_already_deleted(
         [],
     )
 
-    assert len(db.get_column("artifacts", "id").eval()) == 2
+    assert count_artifacts(db) == 2
 
     (cleanup_target / "some-file").unlink()
     (cleanup_target / "some-directory").rmdir()
@@ -127,7 +146,7 @@ def test_run_cleanup_already_deleted(
         [],
     )
 
-    assert len(db.get_column("artifacts", "id").eval()) == 0
+    assert count_artifacts(db) == 0
 
 
 def test_run_cleanup_fifo_ignored(
@@ -150,4 +169,4 @@ def test_run_cleanup_fifo_ignored(
         [],
     )
 
-    assert len(db.get_column("artifacts", "id").eval()) == 0
+    assert count_artifacts(db) == 0
@@ -17,10 +17,101 @@ from dcm_backend.models import (
 from dcm_backend import handlers
 
 
+GOOD_STATUS = Responses.GOOD.status
+
+
+def stage_ids(args) -> list[str]:
+    """Returns test-ids for the given parametrization-arguments."""
+    return [f"stage {i+1}" for i in range(len(args))]
+
+
+token_ok = "37ee72d6-80ab-4dcd-a68d-f8d32766c80d"
+ingest_json_ok = {
+    "archiveId": "a",
+    "target": {
+        "subdirectory": "subdir",
+        "producer": "0",
+        "material_flow": "1",
+    },
+}
+
+
+@pytest.fixture(scope="module", name="config_id_handler_required")
+def _config_id_handler_required():
+    return handlers.get_config_id_handler(True)
+
+
+@pytest.fixture(scope="module", name="config_id_handler_not_required")
+def _config_id_handler_not_required():
+    return handlers.get_config_id_handler(False)
+
+
+@pytest.fixture(scope="module", name="job_config_handler_true")
+def _job_config_handler_true():
+    return handlers.get_job_config_handler(True)
+
+
+@pytest.fixture(scope="module", name="job_config_handler_false")
+def _job_config_handler_false():
+    return handlers.get_job_config_handler(False)
+
+
+@pytest.fixture(scope="module", name="job_config_handler_creation_md")
+def _job_config_handler_creation_md():
+    return handlers.get_job_config_handler(False, accept_creation_md=True)
+
+
+@pytest.fixture(scope="module", name="user_config_handler_true")
+def _user_config_handler_true():
+    return handlers.get_user_config_handler(True)
+
+
+@pytest.fixture(scope="module", name="user_config_handler_false")
+def _user_config_handler_false():
+    return handlers.get_user_config_handler(False)
+
+
+@pytest.fixture(scope="module", name="user_config_handler_creation_md")
+def _user_config_handler_creation_md():
+    return handlers.get_user_config_handler(False, accept_creation_md=True)
+
+
+@pytest.fixture(scope="module", name="workspace_config_handler_true")
+def _workspace_config_handler_true():
+    return handlers.get_workspace_config_handler(True)
+
+
+@pytest.fixture(scope="module", name="workspace_config_handler_false")
+def _workspace_config_handler_false():
+    return handlers.get_workspace_config_handler(False)
+
+
+@pytest.fixture(scope="module", name="workspace_config_handler_creation_md")
+def _workspace_config_handler_creation_md():
+    return handlers.get_workspace_config_handler(
+        False, accept_creation_md=True
+    )
+
+
+@pytest.fixture(scope="module", name="template_config_handler_true")
+def _template_config_handler_true():
+    return handlers.get_template_config_handler(True)
+
+
+@pytest.fixture(scope="module", name="template_config_handler_false")
+def _template_config_handler_false():
+    return handlers.get_template_config_handler(False)
+
+
+@pytest.fixture(scope="module", name="template_config_handler_creation_md")
+def _template_config_handler_creation_md():
+    return handlers.get_template_config_handler(False, accept_creation_md=True)
+
+
 @pytest.mark.parametrize(
     ("json", "status"),
     (
-        pytest_args := [
+        pytest_args := (
             ({"no-ingest": None}, 400),
             ({"ingest": {}}, 400),  # missing both properties
             (  # missing archiveId
@@ -33,80 +124,35 @@ from dcm_backend import handlers
             ),
             (
                 {
-                    "ingest": {
-                        "archiveId": "a",
-                        "target": {
-                            "subdirectory": "subdir",
-                            "producer": "0",
-                            "material_flow": "1",
-                        },
-                    },
+                    "ingest": ingest_json_ok,
                     "callbackUrl": "https://lzv.nrw/callback",
                 },
-                Responses.GOOD.status,
-            ),
-            (
-                {
-                    "ingest": {
-                        "archiveId": "a",
-                        "target": {
-                            "subdirectory": "subdir",
-                            "producer": "0",
-                            "material_flow": "1",
-                        },
-                    },
-                    "token": None,
-                },
-                422,
-            ),
-            (
-                {
-                    "ingest": {
-                        "archiveId": "a",
-                        "target": {
-                            "subdirectory": "subdir",
-                            "producer": "0",
-                            "material_flow": "1",
-                        },
-                    },
-                    "token": "non-uuid",
-                },
-                422,
+                GOOD_STATUS,
             ),
+            ({"ingest": ingest_json_ok, "token": None}, 422),
+            ({"ingest": ingest_json_ok, "token": "non-uuid"}, 422),
             (
-                {
-                    "ingest": {
-                        "archiveId": "a",
-                        "target": {
-                            "subdirectory": "subdir",
-                            "producer": "0",
-                            "material_flow": "1",
-                        },
-                    },
-                    "token": "37ee72d6-80ab-4dcd-a68d-f8d32766c80d",
-                },
-                Responses.GOOD.status,
+                {"ingest": ingest_json_ok, "token": token_ok},
+                GOOD_STATUS,
             ),
-        ]
+        )
     ),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))],
+    ids=stage_ids(pytest_args),
 )
 def test_post_ingest_handler(json, status):
     "Test `post_ingest_handler`."
 
     output = handlers.post_ingest_handler.run(json=json)
 
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
-    else:
+    assert output.last_status == status, output.last_message
+    if status == GOOD_STATUS:
         assert isinstance(output.data.value["ingest"], IngestConfig)
 
 
 @pytest.mark.parametrize(
     ("json", "status"),
     (
-        pytest_args := [
+        pytest_args := (
             ({"no-bundle": None}, 400),
             ({"bundle": {}}, 400),  # missing targets
             (
@@ -123,7 +169,7 @@ def test_post_ingest_handler(json, status):
                         "targets": [],
                     },
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
                 {
@@ -163,21 +209,21 @@ def test_post_ingest_handler(json, status):
                         "targets": [{"path": "a", "asPath": "b"}],
                     },
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
                 {
                     "bundle": {
                         "targets": [],
                     },
-                    "token": "37ee72d6-80ab-4dcd-a68d-f8d32766c80d",
+                    "token": token_ok,
                     "callbackUrl": "https://lzv.nrw/callback",
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
-        ]
+        )
     ),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))],
+    ids=stage_ids(pytest_args),
 )
 def test_get_post_artifact_handler(json, status, file_storage):
     "Test `get_post_artifact_handler`."
@@ -186,16 +232,14 @@ def test_get_post_artifact_handler(json, status, file_storage):
 
     output = handlers.get_post_artifact_handler(file_storage).run(json=json)
 
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
-    else:
+    assert output.last_status == status, output.last_message
+    if status == GOOD_STATUS:
         assert isinstance(output.data.value["bundle"], BundleConfig)
 
 
 @pytest.mark.parametrize(
     ("json", "status"),
-    (pytest_args := [
+    (pytest_args := (
         (
             {"no-id": None},
             400
@@ -206,60 +250,55 @@ def test_get_post_artifact_handler(json, status, file_storage):
         ),
         (
             {"id": "value"},
-            Responses.GOOD.status
+            GOOD_STATUS
         ),
-    ]),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))]
+    )),
+    ids=stage_ids(pytest_args)
 )
-def test_config_id_handler_required(json, status):
+def test_config_id_handler_required(json, status, config_id_handler_required):
     "Test `config_id_handler`."
-    config_id_handler = handlers.get_config_id_handler(True)
-    output = config_id_handler.run(json=json)
+    output = config_id_handler_required.run(json=json)
 
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
-    else:
+    assert output.last_status == status, output.last_message
+    if status == GOOD_STATUS:
         assert isinstance(output.data.value["id_"], str)
 
 
 @pytest.mark.parametrize(
     ("json", "status"),
     (
-        pytest_args := [
+        pytest_args := (
             ({"no-id": None}, 400),
             ({"id": None}, 422),
-            ({"id": "value"}, Responses.GOOD.status),
+            ({"id": "value"}, GOOD_STATUS),
             ({"id": "value", "userTriggered": None}, 422),
-            ({"id": "value", "userTriggered": "value"}, Responses.GOOD.status),
+            ({"id": "value", "userTriggered": "value"}, GOOD_STATUS),
             ({"id": "value", "token": None}, 422),
             ({"id": "value", "token": "non-uuid"}, 422),
             (
                 {
                     "id": "value",
-                    "token": "37ee72d6-80ab-4dcd-a68d-f8d32766c80d",
+                    "token": token_ok,
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
-        ]
+        )
     ),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))],
+    ids=stage_ids(pytest_args),
 )
 def test_post_job_handler(json, status):
     "Test `post_job_handler`."
     output = handlers.post_job_handler.run(json=json)
 
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
+    assert output.last_status == status, output.last_message
 
 
 @pytest.mark.parametrize(
     ("json", "status"),
-    (pytest_args := [
+    (pytest_args := (
         (
             {},
-            Responses.GOOD.status
+            GOOD_STATUS
         ),
         (
             {"id": None},
@@ -267,20 +306,19 @@ def test_post_job_handler(json, status):
         ),
         (
             {"id": "value"},
-            Responses.GOOD.status
+            GOOD_STATUS
         ),
-    ]),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))]
+    )),
+    ids=stage_ids(pytest_args)
 )
-def test_config_id_handler_not_required(json, status):
+def test_config_id_handler_not_required(
+    json, status, config_id_handler_not_required
+):
     "Test `config_id_handler`."
-    config_id_handler = handlers.get_config_id_handler(False)
-    output = config_id_handler.run(json=json)
+    output = config_id_handler_not_required.run(json=json)
 
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
-    else:
+    assert output.last_status == status, output.last_message
+    if status == GOOD_STATUS:
         assert (
             "id_" not in output.data.value
             or isinstance(output.data.value["id_"], str)
@@ -289,9 +327,10 @@ def test_config_id_handler_not_required(json, status):
 
 def get_partial_json(json: dict, skip: list[str]) -> dict:
     """Helper for generating a subset of a given json."""
-    return {
-        k: v for k, v in json.items() if k not in skip
-    }
+    partial_json = json.copy()
+    for k in skip:
+        partial_json.pop(k, None)
+    return partial_json
 
 
 job_config_json_ok = {
@@ -311,33 +350,42 @@ job_config_json_ok = {
     },
 }
 
+# bases for test-cases that replace individual properties of
+# job_config_json_ok
+job_config_json_wo_description = get_partial_json(
+    job_config_json_ok, ["description"]
+)
+job_config_json_wo_name = get_partial_json(job_config_json_ok, ["name"])
+job_config_json_wo_data_selection = get_partial_json(
+    job_config_json_ok, ["dataSelection"]
+)
+job_config_json_wo_data_processing = get_partial_json(
+    job_config_json_ok, ["dataProcessing"]
+)
+job_config_json_wo_schedule = get_partial_json(
+    job_config_json_ok, ["schedule"]
+)
+job_config_json_draft = {"templateId": "d", "status": "draft"}
+
 
 @pytest.mark.parametrize(
     ("json", "status"),
     (
-        pytest_args := [
+        pytest_args := (
             ({"no-status": None}, 400),
             ({"id": ""}, 400),
             ({"id": "i", "status": None, "templateId": "t"}, 422),
             ({"id": "i", "status": "ok", "templateId": None}, 422),
             ({"id": "i", "status": "some status", "templateId": "t"}, 422),
             (
-                get_partial_json(job_config_json_ok, ["description"])
-                | {"description": None},
-                422,
-            ),
-            (
-                get_partial_json(job_config_json_ok, ["name"]),
-                400,
-            ),
-            (
-                get_partial_json(job_config_json_ok, ["name"])
-                | {"name": None},
+                job_config_json_wo_description | {"description": None},
                 422,
             ),
+            (job_config_json_wo_name, 400),
+            (job_config_json_wo_name | {"name": None}, 422),
             (
                 job_config_json_ok,
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
                 {
@@ -350,177 +398,177 @@ job_config_json_ok = {
             ),
             ({"id": None, "status": "draft", "templateId": "t"}, 422),
             (  # dataSelection
-                get_partial_json(job_config_json_ok, ["dataSelection"])
+                job_config_json_wo_data_selection
                 | {
                     "dataSelection": None,
                 },
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataSelection"])
+                job_config_json_wo_data_selection
                 | {
                     "dataSelection": {},
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataSelection"])
+                job_config_json_wo_data_selection
                 | {
                     "dataSelection": {"unknown": None},
                 },
                 400,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataSelection"])
+                job_config_json_wo_data_selection
                 | {
                     "dataSelection": {"path": None},
                 },
                 400,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataSelection"])
+                job_config_json_wo_data_selection
                 | {
                     "dataSelection": {"path": "dir"},
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataSelection"])
+                job_config_json_wo_data_selection
                 | {
                     "dataSelection": {"identifiers": None},
                 },
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataSelection"])
+                job_config_json_wo_data_selection
                 | {
                     "dataSelection": {"identifiers": [None]},
                 },
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataSelection"])
+                job_config_json_wo_data_selection
                 | {
                     "dataSelection": {"identifiers": ["a"]},
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataSelection"])
+                job_config_json_wo_data_selection
                 | {
                     "dataSelection": {"sets": None},
                 },
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataSelection"])
+                job_config_json_wo_data_selection
                 | {
                     "dataSelection": {"sets": [None]},
                 },
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataSelection"])
+                job_config_json_wo_data_selection
                 | {
                     "dataSelection": {"sets": ["a"]},
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataSelection"])
+                job_config_json_wo_data_selection
                 | {
                     "dataSelection": {"from": None},
                 },
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataSelection"])
+                job_config_json_wo_data_selection
                 | {
                     "dataSelection": {"from": "04-08-2023"},
                 },
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataSelection"])
+                job_config_json_wo_data_selection
                 | {
                     "dataSelection": {"from": "2023-08-04"},
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataSelection"])
+                job_config_json_wo_data_selection
                 | {
                     "dataSelection": {"until": None},
                 },
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataSelection"])
+                job_config_json_wo_data_selection
                 | {
                     "dataSelection": {"until": "04-08-2023"},
                 },
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataSelection"])
+                job_config_json_wo_data_selection
                 | {
                     "dataSelection": {"until": "2023-08-04"},
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (  # dataProcessing
-                get_partial_json(job_config_json_ok, ["dataProcessing"])
+                job_config_json_wo_data_processing
                 | {
                     "dataProcessing": None,
                 },
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataProcessing"])
+                job_config_json_wo_data_processing
                 | {
                     "dataProcessing": {},
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataProcessing"])
+                job_config_json_wo_data_processing
                 | {
                     "dataProcessing": {"unknown": None},
                 },
                 400,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataProcessing"])
+                job_config_json_wo_data_processing
                 | {
                     "dataProcessing": {"mapping": None},
                 },
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataProcessing"])
+                job_config_json_wo_data_processing
                 | {
                     "dataProcessing": {"mapping": {}},
                 },
                 400,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataProcessing"])
+                job_config_json_wo_data_processing
                 | {
                     "dataProcessing": {
                         "mapping": {"type": "python", "data": {}}
                     },
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataProcessing"])
+                job_config_json_wo_data_processing
                 | {
                     "dataProcessing": {"mapping": {"type": None, "data": {}}},
                 },
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataProcessing"])
+                job_config_json_wo_data_processing
                 | {
                     "dataProcessing": {
                         "mapping": {"type": "python", "data": None}
@@ -529,7 +577,7 @@ job_config_json_ok = {
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataProcessing"])
+                job_config_json_wo_data_processing
                 | {
                     "dataProcessing": {
                         "mapping": {
@@ -542,10 +590,10 @@ job_config_json_ok = {
                         }
                     },
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataProcessing"])
+                job_config_json_wo_data_processing
                 | {
                     "dataProcessing": {
                         "mapping": {
@@ -559,7 +607,7 @@ job_config_json_ok = {
                 400,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataProcessing"])
+                job_config_json_wo_data_processing
                 | {
                     "dataProcessing": {
                         "mapping": {
@@ -571,10 +619,10 @@ job_config_json_ok = {
                         }
                     },
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataProcessing"])
+                job_config_json_wo_data_processing
                 | {
                     "dataProcessing": {
                         "mapping": {
@@ -588,21 +636,21 @@ job_config_json_ok = {
                 400,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataProcessing"])
+                job_config_json_wo_data_processing
                 | {
                     "dataProcessing": {"preparation": None},
                 },
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataProcessing"])
+                job_config_json_wo_data_processing
                 | {
                     "dataProcessing": {"preparation": {}},
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataProcessing"])
+                job_config_json_wo_data_processing
                 | {
                     "dataProcessing": {
                         "preparation": {"rightsOperations": None}
@@ -611,7 +659,7 @@ job_config_json_ok = {
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataProcessing"])
+                job_config_json_wo_data_processing
                 | {
                     "dataProcessing": {
                         "preparation": {"rightsOperations": [None]}
@@ -620,16 +668,16 @@ job_config_json_ok = {
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataProcessing"])
+                job_config_json_wo_data_processing
                 | {
                     "dataProcessing": {
                         "preparation": {"rightsOperations": [{}]}
                     },
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataProcessing"])
+                job_config_json_wo_data_processing
                 | {
                     "dataProcessing": {
                         "preparation": {"sigPropOperations": None}
@@ -638,16 +686,16 @@ job_config_json_ok = {
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataProcessing"])
+                job_config_json_wo_data_processing
                 | {
                     "dataProcessing": {
                         "preparation": {"sigPropOperations": []}
                     },
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataProcessing"])
+                job_config_json_wo_data_processing
                 | {
                     "dataProcessing": {
                         "preparation": {"preservationOperations": None}
@@ -656,7 +704,7 @@ job_config_json_ok = {
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataProcessing"])
+                job_config_json_wo_data_processing
                 | {
                     "dataProcessing": {
                         "preparation": {"preservationOperations": [None]}
@@ -665,86 +713,86 @@ job_config_json_ok = {
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["dataProcessing"])
+                job_config_json_wo_data_processing
                 | {
                     "dataProcessing": {
                         "preparation": {"preservationOperations": [{}]}
                     },
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (  # schedule
-                get_partial_json(job_config_json_ok, ["schedule"])
+                job_config_json_wo_schedule
                 | {
                     "schedule": None,
                 },
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["schedule"])
+                job_config_json_wo_schedule
                 | {
                     "schedule": {},
                 },
                 400,
             ),
             (
-                get_partial_json(job_config_json_ok, ["schedule"])
+                job_config_json_wo_schedule
                 | {
                     "schedule": {"active": None},
                 },
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["schedule"])
+                job_config_json_wo_schedule
                 | {
                     "schedule": {"active": True},
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
-                get_partial_json(job_config_json_ok, ["schedule"])
+                job_config_json_wo_schedule
                 | {
                     "schedule": {"active": True, "start": None},
                 },
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["schedule"])
+                job_config_json_wo_schedule
                 | {
                     "schedule": {"active": True, "start": "no-ISO"},
                 },
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["schedule"])
+                job_config_json_wo_schedule
                 | {
                     "schedule": {"active": True, "end": None},
                 },
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["schedule"])
+                job_config_json_wo_schedule
                 | {
                     "schedule": {"active": True, "end": "no-ISO"},
                 },
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["schedule"])
+                job_config_json_wo_schedule
                 | {
                     "schedule": {"active": True, "repeat": None},
                 },
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["schedule"])
+                job_config_json_wo_schedule
                 | {
                     "schedule": {"active": True, "repeat": {}},
                 },
                 400,
             ),
             (
-                get_partial_json(job_config_json_ok, ["schedule"])
+                job_config_json_wo_schedule
                 | {
                     "schedule": {
                         "active": True,
@@ -753,10 +801,10 @@ job_config_json_ok = {
                         "repeat": {"unit": "day", "interval": 1},
                     },
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
-                get_partial_json(job_config_json_ok, ["schedule"])
+                job_config_json_wo_schedule
                 | {
                     "schedule": {
                         "active": True,
@@ -766,7 +814,7 @@ job_config_json_ok = {
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["schedule"])
+                job_config_json_wo_schedule
                 | {
                     "schedule": {
                         "active": True,
@@ -776,7 +824,7 @@ job_config_json_ok = {
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["schedule"])
+                job_config_json_wo_schedule
                 | {
                     "schedule": {
                         "active": True,
@@ -786,7 +834,7 @@ job_config_json_ok = {
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["schedule"])
+                job_config_json_wo_schedule
                 | {
                     "schedule": {
                         "active": True,
@@ -796,352 +844,275 @@ job_config_json_ok = {
                 422,
             ),
             (
-                get_partial_json(job_config_json_ok, ["schedule"])
+                job_config_json_wo_schedule
                 | {
                     "schedule": {
                         "active": True,
                         "repeat": {"unit": "day", "interval": 1},
                     },
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
-        ]
+        )
     ),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))],
+    ids=stage_ids(pytest_args),
 )
-def test_get_job_config_handler_true(json, status):
+def test_get_job_config_handler_true(json, status, job_config_handler_true):
     """Test `get_job_config_handler`."""
 
-    output = handlers.get_job_config_handler(True).run(json=json)
+    output = job_config_handler_true.run(json=json)
 
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
-    else:
+    assert output.last_status == status, output.last_message
+    if status == GOOD_STATUS:
         assert isinstance(output.data.value["config"], JobConfig)
 
 
 @pytest.mark.parametrize(
     ("json", "status"),
-    (pytest_args := [
-        (
-            {
-                "templateId": "d",
-                "status": "draft",
-            },
-            Responses.GOOD.status
-        ),
-    ]),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))]
+    (pytest_args := (
+        (job_config_json_draft, GOOD_STATUS),
+    )),
+    ids=stage_ids(pytest_args)
 )
-def test_get_job_config_handler_false(json, status):
+def test_get_job_config_handler_false(
+    json, status, job_config_handler_false
+):
     """Test `get_job_config_handler`."""
 
-    output = handlers.get_job_config_handler(False).run(json=json)
+    output = job_config_handler_false.run(json=json)
 
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
-    else:
+    assert output.last_status == status, output.last_message
+    if status == GOOD_STATUS:
         assert isinstance(output.data.value["config"], JobConfig)
 
 
 @pytest.mark.parametrize(
     ("json", "status"),
     (
-        pytest_args := [
-            (
-                {
-                    "templateId": "d",
-                    "status": "draft",
-                },
-                Responses.GOOD.status,
-            ),
-            (
-                {
-                    "templateId": "d",
-                    "status": "draft",
-                    "userCreated": "a",
-                },
-                Responses.GOOD.status,
-            ),
-            (
-                {
-                    "templateId": "d",
-                    "status": "draft",
-                    "datetimeCreated": "a",
-                },
-                422,
-            ),
-            (
-                {
-                    "templateId": "d",
-                    "status": "draft",
-                    "datetimeCreated": "2024-01-01T00:00:00+01:00",
-                },
-                Responses.GOOD.status,
-            ),
+        pytest_args := (
+            (job_config_json_draft, GOOD_STATUS),
+            (job_config_json_draft | {"userCreated": "a"}, GOOD_STATUS),
+            (job_config_json_draft | {"datetimeCreated": "a"}, 422),
             (
-                {
-                    "templateId": "d",
-                    "status": "draft",
-                    "userModified": "a",
-                },
-                400,
+                job_config_json_draft
+                | {"datetimeCreated": "2024-01-01T00:00:00+01:00"},
+                GOOD_STATUS,
             ),
+            (job_config_json_draft | {"userModified": "a"}, 400),
             (
-                {
-                    "templateId": "d",
-                    "status": "draft",
-                    "datetimeModified": "2024-01-01T00:00:00+01:00",
-                },
+                job_config_json_draft
+                | {"datetimeModified": "2024-01-01T00:00:00+01:00"},
                 400,
             ),
-        ]
+        )
     ),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))],
+    ids=stage_ids(pytest_args),
 )
-def test_get_job_config_handler_created_metadata_true(json, status):
+def test_get_job_config_handler_created_metadata_true(
+    json, status, job_config_handler_creation_md
+):
     """Test `get_job_config_handler`."""
 
-    output = handlers.get_job_config_handler(
-        False, accept_creation_md=True
-    ).run(json=json)
+    output = job_config_handler_creation_md.run(json=json)
 
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
-    else:
+    assert output.last_status == status, output.last_message
+    if status == GOOD_STATUS:
         assert isinstance(output.data.value["config"], JobConfig)
 
 
 @pytest.mark.parametrize(
     ("json", "status"),
     (
-        pytest_args := [
-            (
-                {
-                    "templateId": "d",
-                    "status": "draft",
-                },
-                Responses.GOOD.status,
-            ),
-            (
-                {
-                    "templateId": "d",
-                    "status": "draft",
-                    "userCreated": "a",
-                },
-                400,
-            ),
-            (
-                {
-                    "templateId": "d",
-                    "status": "draft",
-                    "datetimeCreated": "a",
-                },
-                400,
-            ),
-        ]
+        pytest_args := (
+            (job_config_json_draft, GOOD_STATUS),
+            (job_config_json_draft | {"userCreated": "a"}, 400),
+            (job_config_json_draft | {"datetimeCreated": "a"}, 400),
+        )
     ),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))],
+    ids=stage_ids(pytest_args),
 )
-def test_get_job_config_handler_created_metadata_false(json, status):
+def test_get_job_config_handler_created_metadata_false(
+    json, status, job_config_handler_false
+):
     """Test `get_job_config_handler`."""
 
-    output = handlers.get_job_config_handler(
-        False, accept_creation_md=False
-    ).run(json=json)
+    output = job_config_handler_false.run(json=json)
 
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
-    else:
+    assert output.last_status == status, output.last_message
+    if status == GOOD_STATUS:
         assert isinstance(output.data.value["config"], JobConfig)
 
 
 @pytest.mark.parametrize(
     ("json", "status"),
     (
-        pytest_args := [
+        pytest_args := (
             ({}, 400),
             ({"token": None}, 422),
-            ({"token": "t"}, Responses.GOOD.status),
+            ({"token": "t"}, GOOD_STATUS),
             ({"token": "t", "keys": None}, 422),
             ({"token": "t", "keys": "123"}, 422),
             ({"token": "t", "keys": "abc'"}, 422),
-            ({"token": "t", "keys": "abc"}, Responses.GOOD.status),
-            ({"token": "t", "keys": "abc,def"}, Responses.GOOD.status),
-        ]
+            ({"token": "t", "keys": "abc"}, GOOD_STATUS),
+            ({"token": "t", "keys": "abc,def"}, GOOD_STATUS),
+        )
     ),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))],
+    ids=stage_ids(pytest_args),
 )
 def test_get_job_handler(json, status):
     """Test `get_job_handler`."""
 
     output = handlers.get_job_handler.run(json=json)
 
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
+    assert output.last_status == status, output.last_message
 
 
 @pytest.mark.parametrize(
     ("json", "status"),
     (
-        pytest_args := [
+        pytest_args := (
             # bad types do not need testing since this is a handler for
             # query-params
-            ({}, Responses.GOOD.status),
+            ({}, GOOD_STATUS),
             ({"unknown": ""}, 400),
             ({"group": "ab c"}, 422),
-            ({"group": "abc"}, Responses.GOOD.status),
-            ({"group": "abc,def"}, Responses.GOOD.status),
-        ]
+            ({"group": "abc"}, GOOD_STATUS),
+            ({"group": "abc,def"}, GOOD_STATUS),
+        )
     ),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))],
+    ids=stage_ids(pytest_args),
 )
 def test_list_users_handler(json, status):
     """Test `list_users_handler`."""
 
     output = handlers.list_users_handler.run(json=json)
 
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
+    assert output.last_status == status, output.last_message
 
 
 @pytest.mark.parametrize(
     ("json", "status"),
     (
-        pytest_args := [
+        pytest_args := (
             # bad types do not need testing since this is a handler for
             # query-params
-            ({}, Responses.GOOD.status),
+            ({}, GOOD_STATUS),
             ({"unknown": ""}, 400),
-            ({"templateId": "abc"}, Responses.GOOD.status),
-        ]
+            ({"templateId": "abc"}, GOOD_STATUS),
+        )
     ),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))],
+    ids=stage_ids(pytest_args),
 )
 def test_list_job_configs_handler(json, status):
     """Test `list_job_configs_handler`."""
 
     output = handlers.list_job_configs_handler.run(json=json)
 
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
+    assert output.last_status == status, output.last_message
 
 
 @pytest.mark.parametrize(
     ("json", "status"),
     (
-        pytest_args := [
+        pytest_args := (
             # bad types do not need testing since this is a handler for
             # query-params
-            ({}, Responses.GOOD.status),
+            ({}, GOOD_STATUS),
             ({"unknown": ""}, 400),
-            ({"id": "value"}, Responses.GOOD.status),
+            ({"id": "value"}, GOOD_STATUS),
             ({"status": "123"}, 422),
             ({"status": "abc'"}, 422),
-            ({"status": "abc"}, Responses.GOOD.status),
-            ({"status": "abc,def"}, Responses.GOOD.status),
+            ({"status": "abc"}, GOOD_STATUS),
+            ({"status": "abc,def"}, GOOD_STATUS),
             ({"from": "a"}, 422),
-            ({"from": "2025"}, Responses.GOOD.status),
+            ({"from": "2025"}, GOOD_STATUS),
             ({"from": "2025'"}, 422),
-            ({"from": "2025-01-01T12:00:00.000000+00:00"}, Responses.GOOD.status),
+            ({"from": "2025-01-01T12:00:00.000000+00:00"}, GOOD_STATUS),
             ({"to": "a"}, 422),
-            ({"to": "2025"}, Responses.GOOD.status),
+            ({"to": "2025"}, GOOD_STATUS),
             ({"to": "2025'"}, 422),
-            ({"to": "2025-01-01T12:00:00.000000+00:00"}, Responses.GOOD.status),
+            ({"to": "2025-01-01T12:00:00.000000+00:00"}, GOOD_STATUS),
             ({"success": "true'"}, 422),
             ({"success": "abc"}, 422),
-            ({"success": "true"}, Responses.GOOD.status),
-            ({"success": "false"}, Responses.GOOD.status),
-        ]
+            ({"success": "true"}, GOOD_STATUS),
+            ({"success": "false"}, GOOD_STATUS),
+        )
     ),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))],
+    ids=stage_ids(pytest_args),
 )
 def test_list_jobs_handler(json, status):
     """Test `list_jobs_handler`."""
 
     output = handlers.list_jobs_handler.run(json=json)
 
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
+    assert output.last_status == status, output.last_message
 
 
 @pytest.mark.parametrize(
     ("json", "status"),
     (
-        pytest_args := [
+        pytest_args := (
             # bad types do not need testing since this is a handler for
             # query-params
             ({}, 400),
-            ({"jobConfigId": "a"}, Responses.GOOD.status),
+            ({"jobConfigId": "a"}, GOOD_STATUS),
             ({"jobConfigId": "a", "unknown": ""}, 400),
             ({"jobConfigId": "a", "filterByStatus": "unknown"}, 422),
-            ({"jobConfigId": "a", "filterByStatus": "complete"}, Responses.GOOD.status),
-            ({"jobConfigId": "a", "filterByText": "test"}, Responses.GOOD.status),
+            ({"jobConfigId": "a", "filterByStatus": "complete"}, GOOD_STATUS),
+            ({"jobConfigId": "a", "filterByText": "test"}, GOOD_STATUS),
             ({"jobConfigId": "a", "sort": "unknown"}, 422),
-            ({"jobConfigId": "a", "sort": "datetimeChanged"}, Responses.GOOD.status),
+            ({"jobConfigId": "a", "sort": "datetimeChanged"}, GOOD_STATUS),
             ({"jobConfigId": "a", "range": "abc"}, 422),
-            ({"jobConfigId": "a", "range": "0..100"}, Responses.GOOD.status),
+            ({"jobConfigId": "a", "range": "0..100"}, GOOD_STATUS),
             ({"jobConfigId": "a", "count": "unknown"}, 422),
-            ({"jobConfigId": "a", "count": "true"}, Responses.GOOD.status),
-        ]
+            ({"jobConfigId": "a", "count": "true"}, GOOD_STATUS),
+        )
     ),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))],
+    ids=stage_ids(pytest_args),
 )
 def test_get_ies_handler(json, status):
     """Test `get_ies_handler`."""
 
     output = handlers.get_ies_handler.run(json=json)
 
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
+    assert output.last_status == status, output.last_message
 
 
 @pytest.mark.parametrize(
     ("json", "status"),
     (
-        pytest_args := [
+        pytest_args := (
             ({}, 400),
             ({"id": None}, 422),
-            ({"id": "a"}, Responses.GOOD.status),
+            ({"id": "a"}, GOOD_STATUS),
             ({"id": "a", "unknown": None}, 400),
             ({"id": "a", "clear": None}, 422),
-            ({"id": "a", "clear": True}, Responses.GOOD.status),
+            ({"id": "a", "clear": True}, GOOD_STATUS),
             ({"id": "a", "ignore": None}, 422),
-            ({"id": "a", "ignore": True}, Responses.GOOD.status),
+            ({"id": "a", "ignore": True}, GOOD_STATUS),
             ({"id": "a", "planAsBitstream": None}, 422),
-            ({"id": "a", "planAsBitstream": True}, Responses.GOOD.status),
+            ({"id": "a", "planAsBitstream": True}, GOOD_STATUS),
             ({"id": "a", "planToSkipObjectValidation": None}, 422),
             (
                 {"id": "a", "planToSkipObjectValidation": True},
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
-        ]
+        )
     ),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))],
+    ids=stage_ids(pytest_args),
 )
 def test_post_ie_plan_handler(json, status):
     """Test `post_ie_plan_handler`."""
 
     output = handlers.post_ie_plan_handler.run(json=json)
 
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
+    assert output.last_status == status, output.last_message
 
 
 @pytest.mark.parametrize(
     ("json", "status"),
     (
-        pytest_args := [
+        pytest_args := (
             ({"no-id": None}, 400),
             ({"id": None}, 422),
             ({"id": None, "unkown": None}, 400),
@@ -1154,7 +1125,7 @@ def test_post_ie_plan_handler(json, status):
             ({"username": "a", "email": "a"}, 400),
             (
                 {"id": "a", "username": "a", "email": "a@b.c"},
-                Responses().GOOD.status,
+                GOOD_STATUS,
             ),
             ({"id": "a", "username": "a", "externalId": None}, 422),
             (
@@ -1164,13 +1135,13 @@ def test_post_ie_plan_handler(json, status):
                     "externalId": "b",
                     "email": "a@b.c",
                 },
-                Responses().GOOD.status,
+                GOOD_STATUS,
             ),
             ({"id": "a", "username": "a", "status": None}, 422),
             ({"id": "a", "username": "a", "status": "b"}, 422),
             (
                 {"id": "a", "username": "a", "status": "ok", "email": "a@b.c"},
-                Responses().GOOD.status,
+                GOOD_STATUS,
             ),
             (
                 {"id": "a", "username": "a", "email": "a@b.c", "firstname": 0},
@@ -1183,7 +1154,7 @@ def test_post_ie_plan_handler(json, status):
                     "firstname": "b",
                     "email": "a@b.c",
                 },
-                Responses().GOOD.status,
+                GOOD_STATUS,
             ),
             (
                 {"id": "a", "username": "a", "email": "a@b.c", "lastname": 0},
@@ -1196,7 +1167,7 @@ def test_post_ie_plan_handler(json, status):
                     "lastname": "b",
                     "email": "a@b.c",
                 },
-                Responses().GOOD.status,
+                GOOD_STATUS,
             ),
             ({"id": "a", "username": "a", "email": 0}, 422),
             ({"id": "a", "username": "a", "email": "b"}, 422),
@@ -1214,7 +1185,7 @@ def test_post_ie_plan_handler(json, status):
                         {"id": "curator", "workspace": "ws0"},
                     ],
                 },
-                Responses().GOOD.status,
+                GOOD_STATUS,
             ),
             (
                 {
@@ -1247,7 +1218,7 @@ def test_post_ie_plan_handler(json, status):
                     "status": "deleted",
                     "username": "a",
                 },
-                Responses().GOOD.status,
+                GOOD_STATUS,
             ),
             (
                 {
@@ -1257,58 +1228,53 @@ def test_post_ie_plan_handler(json, status):
                     "firstname": "b",
                     "lastname": "c",
                 },
-                Responses().GOOD.status,
+                GOOD_STATUS,
             ),
-        ]
+        )
     ),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))],
+    ids=stage_ids(pytest_args),
 )
-def test_get_user_config_handler_true(
-    json, status
-):
+def test_get_user_config_handler_true(json, status, user_config_handler_true):
     "Test `get_user_config_handler`."
 
-    output = handlers.get_user_config_handler(True).run(json=json)
+    output = user_config_handler_true.run(json=json)
 
-    print(output.last_message)
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
-    else:
+    assert output.last_status == status, output.last_message
+    if status == GOOD_STATUS:
         assert isinstance(output.data.value["config"], UserConfig)
 
 
 @pytest.mark.parametrize(
     ("json", "status"),
     (
-        pytest_args := [
-            ({"username": "a", "email": "a@b.c"}, Responses().GOOD.status),
-        ]
+        pytest_args := (
+            ({"username": "a", "email": "a@b.c"}, GOOD_STATUS),
+        )
     ),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))],
+    ids=stage_ids(pytest_args),
 )
-def test_get_user_config_handler_false(json, status):
+def test_get_user_config_handler_false(
+    json, status, user_config_handler_false
+):
     "Test `get_user_config_handler`."
 
-    output = handlers.get_user_config_handler(False).run(json=json)
+    output = user_config_handler_false.run(json=json)
 
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
-    else:
+    assert output.last_status == status, output.last_message
+    if status == GOOD_STATUS:
         assert isinstance(output.data.value["config"], UserConfig)
 
 
 @pytest.mark.parametrize(
     ("json", "status"),
     (
-        pytest_args := [
+        pytest_args := (
             (
                 {
                     "username": "a",
                     "email": "a@b.c",
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
                 {
@@ -1316,7 +1282,7 @@ def test_get_user_config_handler_false(json, status):
                     "email": "a@b.c",
                     "userCreated": "a",
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
                 {
@@ -1332,7 +1298,7 @@ def test_get_user_config_handler_false(json, status):
                     "email": "a@b.c",
                     "datetimeCreated": "2024-01-01T00:00:00+01:00",
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
                 {
@@ -1350,34 +1316,32 @@ def test_get_user_config_handler_false(json, status):
                 },
                 400,
             ),
-        ]
+        )
     ),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))],
+    ids=stage_ids(pytest_args),
 )
-def test_get_user_config_handler_created_metadata_true(json, status):
+def test_get_user_config_handler_created_metadata_true(
+    json, status, user_config_handler_creation_md
+):
     """Test `get_user_config_handler`."""
 
-    output = handlers.get_user_config_handler(
-        False, accept_creation_md=True
-    ).run(json=json)
+    output = user_config_handler_creation_md.run(json=json)
 
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
-    else:
+    assert output.last_status == status, output.last_message
+    if status == GOOD_STATUS:
         assert isinstance(output.data.value["config"], UserConfig)
 
 
 @pytest.mark.parametrize(
     ("json", "status"),
     (
-        pytest_args := [
+        pytest_args := (
             (
                 {
                     "username": "a",
                     "email": "a@b.c",
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
                 {
@@ -1395,27 +1359,25 @@ def test_get_user_config_handler_created_metadata_true(json, status):
                 },
                 400,
             ),
-        ]
+        )
     ),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))],
+    ids=stage_ids(pytest_args),
 )
-def test_get_user_config_handler_created_metadata_false(json, status):
+def test_get_user_config_handler_created_metadata_false(
+    json, status, user_config_handler_false
+):
     """Test `get_user_config_handler`."""
 
-    output = handlers.get_user_config_handler(
-        False, accept_creation_md=False
-    ).run(json=json)
+    output = user_config_handler_false.run(json=json)
 
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
-    else:
+    assert output.last_status == status, output.last_message
+    if status == GOOD_STATUS:
         assert isinstance(output.data.value["config"], UserConfig)
 
 
 @pytest.mark.parametrize(
     ("json", "status"),
-    (pytest_args := [
+    (pytest_args := (
         (
             {"no-username": None},
             400
@@ -1438,26 +1400,24 @@ def test_get_user_config_handler_created_metadata_false(json, status):
         ),
         (
             {"username": "u", "password": "p"},
-            Responses().GOOD.status
+            GOOD_STATUS
         ),
-    ]),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))]
+    )),
+    ids=stage_ids(pytest_args)
 )
 def test_user_login_handler(json, status):
     "Test `user_login_handler`."
 
     output = handlers.user_login_handler.run(json=json)
 
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
-    else:
+    assert output.last_status == status, output.last_message
+    if status == GOOD_STATUS:
         assert isinstance(output.data.value["credentials"], UserCredentials)
 
 
 @pytest.mark.parametrize(
     ("json", "status"),
-    (pytest_args := [
+    (pytest_args := (
         (
             {"no-username": None},
             400
@@ -1488,20 +1448,18 @@ def test_user_login_handler(json, status):
         ),
         (
             {"username": "u", "password": "p", "newPassword": "p"},
-            Responses().GOOD.status
+            GOOD_STATUS
         ),
-    ]),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))]
+    )),
+    ids=stage_ids(pytest_args)
 )
 def test_user_change_password_handler(json, status):
     "Test `user_change_password_handler`."
 
     output = handlers.user_change_password_handler.run(json=json)
 
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
-    else:
+    assert output.last_status == status, output.last_message
+    if status == GOOD_STATUS:
         assert isinstance(output.data.value["credentials"], UserCredentials)
         assert "new_password" in output.data.value
 
@@ -1509,70 +1467,66 @@ def test_user_change_password_handler(json, status):
 @pytest.mark.parametrize(
     ("json", "status"),
     (
-        pytest_args := [
+        pytest_args := (
             ({"no-name": None}, 400),
             ({"id": "b", "name": None}, 422),
             ({"id": "b", "name": None, "unknown": None}, 400),
             ({"name": "a", "id": True}, 422),
             ({"name": "a", "id": 0}, 422),
-            ({"name": "a", "id": "b"}, Responses().GOOD.status),
-        ]
+            ({"name": "a", "id": "b"}, GOOD_STATUS),
+        )
     ),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))],
+    ids=stage_ids(pytest_args),
 )
 def test_get_workspace_config_handler_true(
-    json, status
+    json, status, workspace_config_handler_true
 ):
     "Test `get_workspace_config_handler`."
 
-    output = handlers.get_workspace_config_handler(True).run(json=json)
+    output = workspace_config_handler_true.run(json=json)
 
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
-    else:
+    assert output.last_status == status, output.last_message
+    if status == GOOD_STATUS:
         assert isinstance(output.data.value["config"], WorkspaceConfig)
 
 
 @pytest.mark.parametrize(
     ("json", "status"),
     (
-        pytest_args := [
-            ({"name": "a"}, Responses().GOOD.status),
-        ]
+        pytest_args := (
+            ({"name": "a"}, GOOD_STATUS),
+        )
     ),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))],
+    ids=stage_ids(pytest_args),
 )
 def test_get_workspace_config_handler_false(
-    json, status
+    json, status, workspace_config_handler_false
 ):
     "Test `get_workspace_config_handler`."
 
-    output = handlers.get_workspace_config_handler(False).run(json=json)
+    output = workspace_config_handler_false.run(json=json)
 
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
-    else:
+    assert output.last_status == status, output.last_message
+    if status == GOOD_STATUS:
         assert isinstance(output.data.value["config"], WorkspaceConfig)
 
 
 @pytest.mark.parametrize(
     ("json", "status"),
     (
-        pytest_args := [
+        pytest_args := (
             (
                 {
                     "name": "a",
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
                 {
                     "name": "a",
                     "userCreated": "a",
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
                 {
@@ -1586,7 +1540,7 @@ def test_get_workspace_config_handler_false(
                     "name": "a",
                     "datetimeCreated": "2024-01-01T00:00:00+01:00",
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
                 {
@@ -1602,33 +1556,31 @@ def test_get_workspace_config_handler_false(
                 },
                 400,
             ),
-        ]
+        )
     ),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))],
+    ids=stage_ids(pytest_args),
 )
-def test_get_workspace_config_handler_created_metadata_true(json, status):
+def test_get_workspace_config_handler_created_metadata_true(
+    json, status, workspace_config_handler_creation_md
+):
     """Test `get_workspace_config_handler`."""
 
-    output = handlers.get_workspace_config_handler(
-        False, accept_creation_md=True
-    ).run(json=json)
+    output = workspace_config_handler_creation_md.run(json=json)
 
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
-    else:
+    assert output.last_status == status, output.last_message
+    if status == GOOD_STATUS:
         assert isinstance(output.data.value["config"], WorkspaceConfig)
 
 
 @pytest.mark.parametrize(
     ("json", "status"),
     (
-        pytest_args := [
+        pytest_args := (
             (
                 {
                     "name": "a",
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
                 {
@@ -1644,28 +1596,26 @@ def test_get_workspace_config_handler_created_metadata_true(json, status):
                 },
                 400,
             ),
-        ]
+        )
     ),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))],
+    ids=stage_ids(pytest_args),
 )
-def test_get_workspace_config_handler_created_metadata_false(json, status):
+def test_get_workspace_config_handler_created_metadata_false(
+    json, status, workspace_config_handler_false
+):
     """Test `get_workspace_config_handler`."""
 
-    output = handlers.get_workspace_config_handler(
-        False, accept_creation_md=False
-    ).run(json=json)
+    output = workspace_config_handler_false.run(json=json)
 
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
-    else:
+    assert output.last_status == status, output.last_message
+    if status == GOOD_STATUS:
         assert isinstance(output.data.value["config"], WorkspaceConfig)
 
 
 @pytest.mark.parametrize(
     ("json", "status"),
     (
-        pytest_args := [
+        pytest_args := (
             ({"no-required": None}, 400),
             ({"id": None}, 400),
             ({"id": None, "unknown": None}, 400),
@@ -1685,7 +1635,7 @@ def test_get_workspace_config_handler_created_metadata_false(json, status):
                     "additionalInformation": {"plugin": "demo", "args": {}},
                     "targetArchive": {"id": "0"},
                 },
-                Responses().GOOD.status,
+                GOOD_STATUS,
             ),
             (
                 {
@@ -1704,7 +1654,7 @@ def test_get_workspace_config_handler_created_metadata_false(json, status):
                         ],
                     },
                 },
-                Responses().GOOD.status,
+                GOOD_STATUS,
             ),
             (
                 {
@@ -1714,7 +1664,7 @@ def test_get_workspace_config_handler_created_metadata_false(json, status):
                     "type": "hotfolder",
                     "additionalInformation": {"sourceId": "some-id"},
                 },
-                Responses().GOOD.status,
+                GOOD_STATUS,
             ),
             (
                 {
@@ -1785,7 +1735,7 @@ def test_get_workspace_config_handler_created_metadata_false(json, status):
                     "type": "hotfolder",
                     "additionalInformation": {"no-path": "."},
                 },
-                Responses().GOOD.status,
+                GOOD_STATUS,
             ),
             (
                 {
@@ -1794,36 +1744,34 @@ def test_get_workspace_config_handler_created_metadata_false(json, status):
                     "type": "hotfolder",
                     "additionalInformation": {"sourceId": None},
                 },
-                Responses().GOOD.status,
+                GOOD_STATUS,
             ),
             (
                 {
                     "id": "a",
                     "status": "draft",
                 },
-                Responses().GOOD.status,
+                GOOD_STATUS,
             ),
-        ]
+        )
     ),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))],
+    ids=stage_ids(pytest_args),
 )
 def test_get_template_config_handler_true(
-    json, status
+    json, status, template_config_handler_true
 ):
     "Test `get_template_config_handler`."
 
-    output = handlers.get_template_config_handler(True).run(json=json)
+    output = template_config_handler_true.run(json=json)
 
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
-    else:
+    assert output.last_status == status, output.last_message
+    if status == GOOD_STATUS:
         assert isinstance(output.data.value["config"], TemplateConfig)
 
 
 @pytest.mark.parametrize(
     ("json", "status"),
-    (pytest_args := [
+    (pytest_args := (
         (
             {
                 "status": "ok",
@@ -1831,29 +1779,27 @@ def test_get_template_config_handler_true(
                 "type": "plugin",
                 "additionalInformation": {"plugin": "demo", "args": {}},
             },
-            Responses().GOOD.status
+            GOOD_STATUS
         ),
-    ]),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))]
+    )),
+    ids=stage_ids(pytest_args)
 )
 def test_get_template_config_handler_false(
-    json, status
+    json, status, template_config_handler_false
 ):
     "Test `get_template_config_handler`."
 
-    output = handlers.get_template_config_handler(False).run(json=json)
+    output = template_config_handler_false.run(json=json)
 
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
-    else:
+    assert output.last_status == status, output.last_message
+    if status == GOOD_STATUS:
         assert isinstance(output.data.value["config"], TemplateConfig)
 
 
 @pytest.mark.parametrize(
     ("json", "status"),
     (
-        pytest_args := [
+        pytest_args := (
             (
                 {
                     "status": "ok",
@@ -1861,7 +1807,7 @@ def test_get_template_config_handler_false(
                     "type": "plugin",
                     "additionalInformation": {"plugin": "demo", "args": {}},
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
                 {
@@ -1871,7 +1817,7 @@ def test_get_template_config_handler_false(
                     "additionalInformation": {"plugin": "demo", "args": {}},
                     "userCreated": "a",
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
                 {
@@ -1891,7 +1837,7 @@ def test_get_template_config_handler_false(
                     "additionalInformation": {"plugin": "demo", "args": {}},
                     "datetimeCreated": "2024-01-01T00:00:00+01:00",
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
                 {
@@ -1913,28 +1859,26 @@ def test_get_template_config_handler_false(
                 },
                 400,
             ),
-        ]
+        )
     ),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))],
+    ids=stage_ids(pytest_args),
 )
-def test_get_template_config_handler_created_metadata_true(json, status):
+def test_get_template_config_handler_created_metadata_true(
+    json, status, template_config_handler_creation_md
+):
     """Test `get_template_config_handler`."""
 
-    output = handlers.get_template_config_handler(
-        False, accept_creation_md=True
-    ).run(json=json)
+    output = template_config_handler_creation_md.run(json=json)
 
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
-    else:
+    assert output.last_status == status, output.last_message
+    if status == GOOD_STATUS:
         assert isinstance(output.data.value["config"], TemplateConfig)
 
 
 @pytest.mark.parametrize(
     ("json", "status"),
     (
-        pytest_args := [
+        pytest_args := (
             (
                 {
                     "status": "ok",
@@ -1942,7 +1886,7 @@ def test_get_template_config_handler_created_metadata_true(json, status):
                     "type": "plugin",
                     "additionalInformation": {"plugin": "demo", "args": {}},
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
                 {
@@ -1964,28 +1908,26 @@ def test_get_template_config_handler_created_metadata_true(json, status):
                 },
                 400,
             ),
-        ]
+        )
     ),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))],
+    ids=stage_ids(pytest_args),
 )
-def test_get_template_config_handler_created_metadata_false(json, status):
+def test_get_template_config_handler_created_metadata_false(
+    json, status, template_config_handler_false
+):
     """Test `get_template_config_handler`."""
 
-    output = handlers.get_template_config_handler(
-        False, accept_creation_md=False
-    ).run(json=json)
+    output = template_config_handler_false.run(json=json)
 
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
-    else:
+    assert output.last_status == status, output.last_message
+    if status == GOOD_STATUS:
         assert isinstance(output.data.value["config"], TemplateConfig)
 
 
 @pytest.mark.parametrize(
     ("json", "status"),
     (
-        pytest_args := [
+        pytest_args := (
             (
                 {
                     "name": "a",
@@ -2017,7 +1959,7 @@ def test_get_template_config_handler_created_metadata_false(json, status):
                     "id": "0",
                     "name": "a",
                 },
-                Responses.GOOD.status,
+                GOOD_STATUS,
             ),
             (
                 {
@@ -2027,15 +1969,13 @@ def test_get_template_config_handler_created_metadata_false(json, status):
                 },
                 400,
             ),
-        ]
+        )
     ),
-    ids=[f"stage {i+1}" for i in range(len(pytest_args))],
+    ids=stage_ids(pytest_args),
 )
 def test_template_hotfolder_new_directory_handler(json, status):
     """Test `template_hotfolder_new_directory_handler`."""
 
     output = handlers.template_hotfolder_new_directory_handler.run(json=json)
 
-    assert output.last_status == status
-    if status != Responses.GOOD.status:
-        print(output.last_message)
+    assert output.last_status == status, output.last_message
@@ -16,7 +16,6 @@ test_rosettaresult_json = get_model_serialization_test(
     ),
 )
 
-print(RosettaResult().json)
 
 test_ingestresult_json = get_model_serialization_test(
     IngestResult,
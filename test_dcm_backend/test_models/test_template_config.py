@@ -12,6 +12,28 @@ from dcm_backend.models.template_config import (
 )
 
 
+plugin_info = PluginInfo("p-0", {"arg0": "value0"})
+hotfolder_info = HotfolderInfo("some-id")
+transfer_url_filter = TransferUrlFilter(
+    r"(https://lzv\.nrw/oai/transfer=[a-z0-9]+)", "0"
+)
+oai_info = OAIInfo("url", "prefix", [transfer_url_filter])
+template_config_kwargs = {
+    "status": "ok",
+    "id_": "a",
+    "workspace_id": "ws0",
+    "name": "Display Name",
+    "description": "some description",
+    "type_": "plugin",
+    "additional_information": PluginInfo("p-0", {}),
+    "target_archive": TargetArchive("0"),
+    "user_created": "a",
+    "datetime_created": "0",
+    "user_modified": "b",
+    "datetime_modified": "1",
+}
+
+
 test_plugin_info_json = get_model_serialization_test(
     PluginInfo,
     (
@@ -29,7 +51,7 @@ test_plugin_info_json = get_model_serialization_test(
 
 def test_plugin_info_row_from_row():
     """Test database-serialization."""
-    row = PluginInfo("p-0", {"arg0": "value0"}).row
+    row = plugin_info.row
     assert PluginInfo.from_row(row).row == row
 
 
@@ -49,7 +71,7 @@ test_hotfolder_info_json = get_model_serialization_test(
 
 def test_hotfolder_info_row_from_row():
     """Test database-serialization."""
-    row = HotfolderInfo("some-id").row
+    row = hotfolder_info.row
     assert HotfolderInfo.from_row(row).row == row
 
 
@@ -75,9 +97,7 @@ test_transfer_url_filter_json = get_model_serialization_test(
 
 def test_transfer_url_filter_row_from_row():
     """Test database-serialization."""
-    row = TransferUrlFilter(
-        r"(https://lzv\.nrw/oai/transfer=[a-z0-9]+)", "0"
-    ).row
+    row = transfer_url_filter.row
     assert TransferUrlFilter.from_row(row).row == row
 
 
@@ -90,12 +110,7 @@ test_oai_info_json = get_model_serialization_test(
             {
                 "url": "url",
                 "metadata_prefix": "prefix",
-                "transfer_url_filters": [
-                    TransferUrlFilter(
-                        r"(https://lzv\.nrw/oai/transfer=[a-z0-9]+)",
-                        "0",
-                    )
-                ],
+                "transfer_url_filters": [transfer_url_filter],
             },
         ),
     ),
@@ -104,16 +119,7 @@ test_oai_info_json = get_model_serialization_test(
 
 def test_oai_info_row_from_row():
     """Test database-serialization."""
-    row = OAIInfo(
-        "url",
-        "prefix",
-        [
-            TransferUrlFilter(
-                r"(https://lzv\.nrw/oai/transfer=[a-z0-9]+)",
-                "0",
-            )
-        ],
-    ).row
+    row = oai_info.row
     assert OAIInfo.from_row(row).row == row
 
 
@@ -151,23 +157,7 @@ test_template_config_json = get_model_serialization_test(
                 "additional_information": {"any": "data"},
             },
         ),
-        (
-            (),
-            {
-                "status": "ok",
-                "id_": "a",
-                "workspace_id": "ws0",
-                "name": "Display Name",
-                "description": "some description",
-                "type_": "plugin",
-                "additional_information": PluginInfo("p-0", {}),
-                "target_archive": TargetArchive("0"),
-                "user_created": "a",
-                "datetime_created": "0",
-                "user_modified": "b",
-                "datetime_modified": "1",
-            },
-        ),
+        ((), template_config_kwargs),
         (
             (),
             {
@@ -176,7 +166,7 @@ test_template_config_json = get_model_serialization_test(
                 "workspace_id": "ws0",
                 "name": "Display Name",
                 "type_": "hotfolder",
-                "additional_information": HotfolderInfo("some-id"),
+                "additional_information": hotfolder_info,
             },
         ),
         (
@@ -196,20 +186,7 @@ test_template_config_json = get_model_serialization_test(
 
 def test_template_config_row_from_row():
     """Test database-serialization."""
-    row = TemplateConfig(
-        status="ok",
-        id_="a",
-        workspace_id="ws0",
-        name="Display Name",
-        description="some description",
-        type_="plugin",
-        additional_information=PluginInfo("p-0", {}),
-        target_archive=TargetArchive("0"),
-        user_created="a",
-        datetime_created="0",
-        user_modified="b",
-        datetime_modified="1",
-    ).row
+    row = TemplateConfig(**template_config_kwargs).row
     assert TemplateConfig.from_row(row).row == row
 
 
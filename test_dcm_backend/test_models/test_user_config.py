@@ -10,6 +10,25 @@ from dcm_backend.models.user_config import (
 )
 
 
+user_config_kwargs = {
+    "id_": "a",
+    "external_id": "b",
+    "username": "a",
+    "status": "ok",
+    "firstname": "c",
+    "lastname": "d",
+    "groups": [
+        GroupMembership("group1"),
+        GroupMembership("group2", "workspace01"),
+    ],
+    "widget_config": {"widget0": {"arg0": 0, "arg1": "a"}},
+    "user_created": "a",
+    "datetime_created": "0",
+    "user_modified": "b",
+    "datetime_modified": "1",
+}
+
+
 test_group_membership_json = get_model_serialization_test(
     GroupMembership,
     (
@@ -23,26 +42,7 @@ test_user_config_json = get_model_serialization_test(
     UserConfig,
     (
         ((), {}),
-        (
-            (),
-            {
-                "id_": "a",
-                "external_id": "b",
-                "username": "a",
-                "status": "ok",
-                "firstname": "c",
-                "lastname": "d",
-                "groups": [
-                    GroupMembership("group1"),
-                    GroupMembership("group2", "workspace01"),
-                ],
-                "widget_config": {"widget0": {"arg0": 0, "arg1": "a"}},
-                "user_created": "a",
-                "datetime_created": "0",
-                "user_modified": "b",
-                "datetime_modified": "1",
-            },
-        ),
+        ((), user_config_kwargs),
     ),
 )
 
@@ -69,21 +69,5 @@ test_user_credentials_json = get_model_serialization_test(
 
 def test_user_config_row_from_row():
     """Test database-serialization."""
-    row = UserConfig(
-        id_="a",
-        external_id="b",
-        username="a",
-        status="ok",
-        firstname="c",
-        lastname="d",
-        groups=[
-            GroupMembership("group1"),
-            GroupMembership("group2", "workspace01"),
-        ],
-        widget_config={"widget0": {"arg0": 0, "arg1": "a"}},
-        user_created="a",
-        datetime_created="0",
-        user_modified="b",
-        datetime_modified="1",
-    ).row
+    row = UserConfig(**user_config_kwargs).row
     assert UserConfig.from_row(row).row == row